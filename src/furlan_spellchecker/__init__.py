@@ -1,35 +1,72 @@
-"""FurlanSpellChecker public API."""
+"""FurlanSpellChecker public API.
+
+Public names are resolved lazily (PEP 562) so that ``import furlan_spellchecker``
+only loads the submodules that are actually used.
+"""
 
 from __future__ import annotations
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .__about__ import __version__
-from .core.interfaces import (
-    IDictionary,
-    IPhoneticAlgorithm,
-    ISpellChecker,
-    ITextProcessor,
-)
-from .dictionary import Dictionary, RadixTreeDictionary
-from .entities import IProcessedElement, ProcessedPunctuation, ProcessedWord
-from .phonetic import FurlanPhoneticAlgorithm
-from .services import IOService, SpellCheckPipeline
-from .spellchecker import FurlanSpellChecker, TextProcessor
-from .config import (
-    FurlanSpellCheckerConfig,
-    DictionaryConfig,
-    SpellCheckerConfig,
-    TextProcessingConfig,
-    PhoneticConfig,
-)
+
+if TYPE_CHECKING:
+    from .config import (
+        DictionaryConfig,
+        FurlanSpellCheckerConfig,
+        PhoneticConfig,
+        SpellCheckerConfig,
+        TextProcessingConfig,
+    )
+    from .core.interfaces import (
+        IDictionary,
+        IPhoneticAlgorithm,
+        ISpellChecker,
+        ITextProcessor,
+    )
+    from .dictionary import Dictionary, RadixTreeDictionary
+    from .entities import IProcessedElement, ProcessedPunctuation, ProcessedWord
+    from .phonetic import FurlanPhoneticAlgorithm
+    from .services import IOService, SpellCheckPipeline
+    from .spellchecker import FurlanSpellChecker, TextProcessor
 
 version = __version__
 
+# Public name -> submodule (relative to this package) that defines it
+_LAZY_IMPORTS: dict[str, str] = {
+    # Core interfaces
+    "ISpellChecker": ".core.interfaces",
+    "IDictionary": ".core.interfaces",
+    "IPhoneticAlgorithm": ".core.interfaces",
+    "ITextProcessor": ".core.interfaces",
+    # Main implementations
+    "FurlanSpellChecker": ".spellchecker",
+    "TextProcessor": ".spellchecker",
+    "Dictionary": ".dictionary",
+    "RadixTreeDictionary": ".dictionary",
+    "FurlanPhoneticAlgorithm": ".phonetic",
+    # Entities
+    "IProcessedElement": ".entities",
+    "ProcessedWord": ".entities",
+    "ProcessedPunctuation": ".entities",
+    # Services
+    "SpellCheckPipeline": ".services",
+    "IOService": ".services",
+    # Configuration
+    "FurlanSpellCheckerConfig": ".config",
+    "DictionaryConfig": ".config",
+    "SpellCheckerConfig": ".config",
+    "TextProcessingConfig": ".config",
+    "PhoneticConfig": ".config",
+}
+
 __all__ = [
     "version",
     # Core interfaces
     "ISpellChecker",
     "IDictionary",
-    "IPhoneticAlgorithm", 
+    "IPhoneticAlgorithm",
     "ITextProcessor",
     # Main implementations
     "FurlanSpellChecker",
@@ -40,14 +77,30 @@ __all__ = [
     # Entities
     "IProcessedElement",
     "ProcessedWord",
-    "ProcessedPunctuation", 
+    "ProcessedPunctuation",
     # Services
     "SpellCheckPipeline",
     "IOService",
     # Configuration
     "FurlanSpellCheckerConfig",
     "DictionaryConfig",
-    "SpellCheckerConfig", 
+    "SpellCheckerConfig",
     "TextProcessingConfig",
     "PhoneticConfig",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module attributes including the lazily imported ones."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
@@ -2,15 +2,52 @@
 
 from __future__ import annotations
 
-import asyncio
+import functools
+import os
 import sys
+from collections.abc import Callable, Iterable
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, BinaryIO, Optional, TextIO, cast
 
 import click
 
-from ..services import SpellCheckPipeline, IOService
-from ..dictionary import Dictionary
+# The pipeline and its dependencies are imported inside the commands that use
+# them so that --help and argument errors only pay for importing click.
+if TYPE_CHECKING:
+    import socketserver
+
+    from ..dictionary import Dictionary
+    from ..services import SpellCheckPipeline
+
+
+@functools.lru_cache(maxsize=4)
+def _load_dictionary(dictionary_path: str, mtime_ns: int, size: int) -> Dictionary:
+    """Load a dictionary file, cached by absolute path, mtime and size."""
+    from ..dictionary import Dictionary
+
+    dict_obj = Dictionary()
+    dict_obj.load_dictionary(dictionary_path)
+    return dict_obj
+
+
+def _get_pipeline(dictionary: Optional[str]) -> SpellCheckPipeline:
+    """Build a fresh pipeline, reusing dictionaries already loaded in this process.
+
+    Pipelines keep per-check state, so only the dictionary, which the CLI
+    never modifies, is shared between them.
+    """
+    from ..dictionary import Dictionary
+    from ..services import SpellCheckPipeline
+
+    if not dictionary:
+        return SpellCheckPipeline(dictionary=Dictionary())
+
+    dictionary_path = os.path.abspath(dictionary)
+    # Nanosecond mtime plus size catches rewrites within the float mtime resolution
+    stat = os.stat(dictionary_path)
+    return SpellCheckPipeline(
+        dictionary=_load_dictionary(dictionary_path, stat.st_mtime_ns, stat.st_size)
+    )
 
 
 @click.group()
@@ -44,20 +81,17 @@ def main(ctx: click.Context) -> None:
 )
 def check(text: str, dictionary: Optional[str], output: Optional[str], format: str) -> None:
     """Check spelling of the given text."""
+    from ..services import IOService
+
     # Initialize pipeline
-    dict_obj = Dictionary()
-    if dictionary:
-        dict_obj.load_dictionary(dictionary)
-    
-    pipeline = SpellCheckPipeline(dictionary=dict_obj)
+    pipeline = _get_pipeline(dictionary)
     
     # Check text
     result = pipeline.check_text(text)
     
     # Format output
     if format == "json":
-        import json
-        output_content = json.dumps(result, ensure_ascii=False, indent=2)
+        output_content = _dumps_json(result)
     else:
         output_content = _format_text_result(result)
     
@@ -87,15 +121,11 @@ def check(text: str, dictionary: Optional[str], output: Optional[str], format: s
 def suggest(word: str, dictionary: Optional[str], max_suggestions: int) -> None:
     """Get spelling suggestions for a word."""
     # Initialize pipeline
-    dict_obj = Dictionary()
-    if dictionary:
-        dict_obj.load_dictionary(dictionary)
-    
-    pipeline = SpellCheckPipeline(dictionary=dict_obj)
+    pipeline = _get_pipeline(dictionary)
     
     # Get suggestions
     try:
-        suggestions = asyncio.run(pipeline.get_suggestions(word, max_suggestions))
+        suggestions = pipeline.get_suggestions_sync(word, max_suggestions)
         
         if suggestions:
             click.echo(f"Suggestions for '{word}':")
@@ -120,15 +150,11 @@ def suggest(word: str, dictionary: Optional[str], max_suggestions: int) -> None:
 def lookup(word: str, dictionary: Optional[str]) -> None:
     """Check if a word is in the dictionary."""
     # Initialize pipeline
-    dict_obj = Dictionary()
-    if dictionary:
-        dict_obj.load_dictionary(dictionary)
-    
-    pipeline = SpellCheckPipeline(dictionary=dict_obj)
+    pipeline = _get_pipeline(dictionary)
     
     # Check word
     try:
-        result = asyncio.run(pipeline.check_word(word))
+        result = pipeline.check_word_sync(word)
         
         if result["is_correct"]:
             click.echo(f"✓ '{word}' is correct")
@@ -161,44 +187,239 @@ def lookup(word: str, dictionary: Optional[str]) -> None:
 )
 def file(input_file: str, output: Optional[str], dictionary: Optional[str]) -> None:
     """Check spelling of text from a file."""
+    from ..services import IOService
+
+    # The input is read lazily, so it must not be the file being written
+    if output and os.path.exists(output) and os.path.samefile(input_file, output):
+        raise click.BadParameter("must not be the input file", param_hint="'--output'")
+
     try:
-        # Read input file
-        text = IOService.read_text_file(input_file)
-        
         # Initialize pipeline
-        dict_obj = Dictionary()
-        if dictionary:
-            dict_obj.load_dictionary(dictionary)
-        
-        pipeline = SpellCheckPipeline(dictionary=dict_obj)
-        
-        # Check text
-        result = pipeline.check_text(text)
+        pipeline = _get_pipeline(dictionary)
         
-        # Write output
+        # Check the input line by line, writing output as it is produced
+        lines = IOService.iter_text_lines(input_file)
         if output:
-            IOService.write_text_file(output, result["processed_text"])
+            with IOService.open_text_writer(output) as target:
+                summary = _check_lines(pipeline, lines, lambda line: target.write(line + "\n"))
             click.echo(f"Corrected text written to: {output}")
         else:
             click.echo("Corrected text:")
-            click.echo(result["processed_text"])
+            echo = _BufferedEcho()
+            try:
+                summary = _check_lines(pipeline, lines, echo.write_line)
+            finally:
+                echo.flush()
         
         # Show summary
         click.echo(f"\nSummary:")
-        click.echo(f"  Total words: {result['total_words']}")
-        click.echo(f"  Incorrect words: {result['incorrect_count']}")
+        click.echo(f"  Total words: {summary['total_words']}")
+        click.echo(f"  Incorrect words: {summary['incorrect_count']}")
         
-        if result["incorrect_words"]:
+        if summary["incorrect_words"]:
             click.echo("  Incorrect words found:")
-            for word_info in result["incorrect_words"]:
-                click.echo(f"    - {word_info['original']}")
+            for word in summary["incorrect_words"]:
+                click.echo(f"    - {word}")
                 
     except Exception as e:
         click.echo(f"Error processing file: {e}", err=True)
         sys.exit(1)
 
 
-def _format_text_result(result: dict) -> str:
+class _BufferedEcho:
+    """Collect output lines and pass them to click.echo in batches.
+
+    click.echo flushes on every call, so echoing each line of a large file
+    separately is slow; batching keeps click's console and encoding handling.
+    """
+
+    def __init__(self, max_lines: int = 1024) -> None:
+        """Initialize an empty buffer."""
+        self._lines: list[str] = []
+        self._max_lines = max_lines
+
+    def write_line(self, line: str) -> None:
+        """Queue a line, echoing the batch once it is full."""
+        self._lines.append(line)
+        if len(self._lines) >= self._max_lines:
+            self.flush()
+
+    def flush(self) -> None:
+        """Echo and clear all queued lines."""
+        if self._lines:
+            click.echo("\n".join(self._lines))
+            self._lines.clear()
+
+
+def _check_lines(
+    pipeline: SpellCheckPipeline, lines: Iterable[str], emit: Callable[[str], object]
+) -> dict[str, Any]:
+    """Check lines one at a time, emitting each corrected line, and return totals."""
+    summary: dict[str, Any] = {"total_words": 0, "incorrect_count": 0, "incorrect_words": []}
+    
+    for result in pipeline.check_text_stream(lines):
+        emit(result["processed_text"])
+        summary["total_words"] += result["total_words"]
+        summary["incorrect_count"] += result["incorrect_count"]
+        summary["incorrect_words"].extend(
+            word_info["original"] for word_info in result["incorrect_words"]
+        )
+    
+    return summary
+
+
+@main.command()
+@click.option(
+    "--dictionary", 
+    "-d", 
+    type=click.Path(exists=True),
+    help="Path to dictionary file"
+)
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(),
+    help="Listen on a UNIX domain socket instead of stdin/stdout"
+)
+def serve(dictionary: Optional[str], socket_path: Optional[str]) -> None:
+    """Answer line-based requests from a long-running process.
+
+    Each request is one line: ``CHECK <text>``, ``LOOKUP <word>`` or
+    ``SUGGEST <word> [n]``; ``QUIT`` ends the session. CHECK and LOOKUP
+    reply ``ok`` or ``no<TAB>item,item``; SUGGEST replies with the
+    comma-separated suggestions.
+    """
+    import socketserver
+
+    # Loading up front reports a bad dictionary before any client connects
+    pipeline = _get_pipeline(dictionary)
+
+    if not socket_path:
+        _serve_stream(pipeline, sys.stdin, sys.stdout)
+        return
+
+    if not hasattr(socketserver, "ThreadingUnixStreamServer"):
+        raise click.UsageError("--socket requires UNIX domain socket support")
+
+    _remove_stale_socket(socket_path)
+
+    server = _make_unix_server(socket_path, dictionary)
+    click.echo(f"Listening on {socket_path}", err=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        Path(socket_path).unlink(missing_ok=True)
+
+
+def _remove_stale_socket(socket_path: str) -> None:
+    """Remove a socket left behind by a previous server, refusing a live one."""
+    import socket
+
+    if not Path(socket_path).is_socket():
+        return
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(socket_path)
+        except ConnectionRefusedError:
+            # Nothing is listening any more
+            os.unlink(socket_path)
+            return
+
+    raise click.UsageError(f"socket {socket_path} in use by another server")
+
+
+def _make_unix_server(
+    socket_path: str, dictionary: Optional[str]
+) -> socketserver.ThreadingUnixStreamServer:
+    """Create a threaded UNIX socket server answering serve requests."""
+    import io
+    import socketserver
+
+    class _RequestHandler(socketserver.StreamRequestHandler):
+        def handle(self) -> None:
+            reader = io.TextIOWrapper(cast(BinaryIO, self.rfile), encoding="utf-8")
+            writer = io.TextIOWrapper(
+                cast(BinaryIO, self.wfile), encoding="utf-8", write_through=True
+            )
+            try:
+                # Each connection gets its own pipeline over the shared, read-only dictionary
+                _serve_stream(_get_pipeline(dictionary), reader, writer)
+            finally:
+                reader.detach()
+                writer.detach()
+
+    server = socketserver.ThreadingUnixStreamServer(socket_path, _RequestHandler)
+    # Open client connections must not keep the process alive after shutdown
+    server.daemon_threads = True
+    return server
+
+
+def _serve_stream(pipeline: SpellCheckPipeline, reader: TextIO, writer: TextIO) -> None:
+    """Serve requests read line by line from a text stream."""
+    for line in reader:
+        request = line.strip()
+        if not request:
+            continue
+        if request.upper() in ("Q", "QUIT"):
+            break
+
+        response = _handle_request(pipeline, request)
+        writer.write(response + "\n")
+        writer.flush()
+
+
+def _handle_request(pipeline: SpellCheckPipeline, request: str) -> str:
+    """Dispatch a single serve request and return the response line."""
+    command, _, argument = request.partition(" ")
+    command = command.upper()
+    argument = argument.strip()
+
+    if not argument:
+        return f"error\tmissing argument for {command}"
+
+    try:
+        if command == "CHECK":
+            result = pipeline.check_text(argument)
+            incorrect = [word_info["original"] for word_info in result["incorrect_words"]]
+            return "no\t" + ",".join(incorrect) if incorrect else "ok"
+
+        if command == "LOOKUP":
+            result = pipeline.check_word_sync(argument)
+            if result["is_correct"]:
+                return "ok"
+            return "no\t" + ",".join(result["suggestions"])
+
+        if command == "SUGGEST":
+            word, _, count = argument.partition(" ")
+            max_suggestions = int(count) if count.strip() else 10
+            if max_suggestions < 1:
+                return f"error\tsuggestion count must be at least 1, got {max_suggestions}"
+            suggestions = pipeline.get_suggestions_sync(word, max_suggestions)
+            return ",".join(suggestions)
+
+    except Exception as e:
+        return f"error\t{e}"
+
+    return f"error\tunknown command {command}"
+
+
+def _dumps_json(result: dict[str, Any]) -> str:
+    """Serialize a result as indented JSON, using orjson when it is installed."""
+    try:
+        import orjson
+    except ImportError:
+        import json
+
+        return json.dumps(result, ensure_ascii=False, indent=2)
+
+    return orjson.dumps(result, option=orjson.OPT_INDENT_2).decode("utf-8")
+
+
+def _format_text_result(result: dict[str, Any]) -> str:
     """Format spell check result as text."""
     lines = [
         f"Original text: {result['original_text']}",
@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from typing import Optional, Dict, Any
 from pathlib import Path
 
 
-@dataclass
+@dataclass(slots=True)
 class DictionaryConfig:
     """Configuration for dictionary settings."""
     
@@ -18,7 +18,7 @@ class DictionaryConfig:
     use_phonetic_suggestions: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class SpellCheckerConfig:
     """Configuration for spell checker behavior."""
     
@@ -30,7 +30,7 @@ class SpellCheckerConfig:
     auto_correct: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class TextProcessingConfig:
     """Configuration for text processing."""
     
@@ -45,7 +45,7 @@ class TextProcessingConfig:
             self.custom_tokenization_rules = {}
 
 
-@dataclass
+@dataclass(slots=True)
 class PhoneticConfig:
     """Configuration for phonetic algorithm."""
     
@@ -60,7 +60,7 @@ class PhoneticConfig:
             self.custom_rules = {}
 
 
-@dataclass
+@dataclass(slots=True)
 class FurlanSpellCheckerConfig:
     """Main configuration class for FurlanSpellChecker."""
     
@@ -98,31 +98,23 @@ class FurlanSpellCheckerConfig:
     def to_dict(self) -> Dict[str, Any]:
         """Convert configuration to dictionary."""
         return {
-            "dictionary": {
-                "main_dictionary_path": self.dictionary.main_dictionary_path,
-                "user_dictionary_path": self.dictionary.user_dictionary_path,
-                "auto_load_user_dict": self.dictionary.auto_load_user_dict,
-                "max_suggestions": self.dictionary.max_suggestions,
-                "use_phonetic_suggestions": self.dictionary.use_phonetic_suggestions,
-            },
-            "spell_checker": {
-                "ignore_capitalized": self.spell_checker.ignore_capitalized,
-                "ignore_all_caps": self.spell_checker.ignore_all_caps,
-                "ignore_numbers": self.spell_checker.ignore_numbers,
-                "ignore_mixed_case": self.spell_checker.ignore_mixed_case,
-                "min_word_length": self.spell_checker.min_word_length,
-                "auto_correct": self.spell_checker.auto_correct,
-            },
-            "text_processing": {
-                "preserve_formatting": self.text_processing.preserve_formatting,
-                "split_contractions": self.text_processing.split_contractions,
-                "handle_abbreviations": self.text_processing.handle_abbreviations,
-                "custom_tokenization_rules": self.text_processing.custom_tokenization_rules,
-            },
-            "phonetic": {
-                "algorithm_variant": self.phonetic.algorithm_variant,
-                "similarity_threshold": self.phonetic.similarity_threshold,
-                "enable_dialect_variants": self.phonetic.enable_dialect_variants,
-                "custom_rules": self.phonetic.custom_rules,
-            },
-        }
\ No newline at end of file
+            name: _fields_to_dict(getattr(self, name)) for name in _field_names(type(self))
+        }
+
+
+# A plain dict rather than functools.cache: mypy rejects dataclass types as
+# arguments to a cached function because their instances are unhashable
+_FIELD_NAMES: Dict[type[Any], tuple[str, ...]] = {}
+
+
+def _field_names(config_type: type[Any]) -> tuple[str, ...]:
+    """Get the field names of a configuration dataclass, computed once per class."""
+    names = _FIELD_NAMES.get(config_type)
+    if names is None:
+        names = _FIELD_NAMES[config_type] = tuple(field.name for field in fields(config_type))
+    return names
+
+
+def _fields_to_dict(config: Any) -> Dict[str, Any]:
+    """Convert a flat configuration dataclass to a dictionary of its fields."""
+    return {name: getattr(config, name) for name in _field_names(type(config))}
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
 from collections.abc import Iterable
 from typing import Any
@@ -39,11 +40,29 @@ class ISpellChecker(ABC):
         """Check if the given word is correct."""
         raise NotImplementedError
 
+    def check_word_sync(self, word: ProcessedWord) -> bool:
+        """Check if the given word is correct without an event loop.
+
+        The default runs :meth:`check_word` on a new event loop; implementations
+        that can answer synchronously should override it.
+        """
+        return asyncio.run(self.check_word(word))
+
     @abstractmethod
     async def get_word_suggestions(self, word: ProcessedWord) -> list[str]:
         """Get suggestions for the given word."""
         raise NotImplementedError
 
+    def get_word_suggestions_sync(
+        self, word: ProcessedWord, max_suggestions: int = 10
+    ) -> list[str]:
+        """Get up to ``max_suggestions`` suggestions for the word without an event loop.
+
+        The default runs :meth:`get_word_suggestions` on a new event loop;
+        implementations that can answer synchronously should override it.
+        """
+        return asyncio.run(self.get_word_suggestions(word))[:max_suggestions]
+
     @abstractmethod
     def swap_word_with_suggested(self, original_word: ProcessedWord, suggested_word: str) -> None:
         """Replace the original word with the suggested one."""
@@ -1,11 +1,16 @@
 """Dictionary module initialization."""
 
 from .dictionary import Dictionary, RadixTreeDictionary
+from .edit_distance import levenshtein_distance, levenshtein_neighbours
 from .radix_tree import RadixTree, RadixTreeNode
+from .symspell import SymSpellIndex
 
 __all__ = [
     "Dictionary",
     "RadixTreeDictionary",
     "RadixTree",
     "RadixTreeNode",
+    "SymSpellIndex",
+    "levenshtein_distance",
+    "levenshtein_neighbours",
 ]
\ No newline at end of file
@@ -2,21 +2,35 @@
 
 from __future__ import annotations
 
+import functools
 import os
 from pathlib import Path
 from typing import Set
 
 from ..core.exceptions import DictionaryError, DictionaryNotFoundError, DictionaryLoadError
 from ..core.interfaces import IDictionary
+from .radix_tree import RadixTree
+from .symspell import SymSpellIndex
+
+# Shorter words are too short for their first letters to be trusted as correct
+_MIN_ANCHORED_WORD_LENGTH = 4
 
 
 class Dictionary(IDictionary):
     """Basic dictionary implementation."""
 
-    def __init__(self) -> None:
-        """Initialize the dictionary."""
+    def __init__(self, cache_size: int = 65536) -> None:
+        """Initialize the dictionary.
+
+        Suggestions for the last ``cache_size`` distinct queries are memoized,
+        since the same misspellings tend to recur throughout a document.
+        """
         self._words: Set[str] = set()
+        self._create_index()
         self._loaded = False
+        self._cached_suggestions = functools.lru_cache(maxsize=cache_size)(
+            self._lookup_suggestions
+        )
 
     def contains_word(self, word: str) -> bool:
         """Check if the dictionary contains the given word."""
@@ -27,37 +41,29 @@ class Dictionary(IDictionary):
         if not word or not word.strip():
             return False
         
-        self._words.add(word.lower().strip())
+        normalized = word.lower().strip()
+        if normalized not in self._words:
+            self._words.add(normalized)
+            self._index_word(normalized)
+            self._cached_suggestions.cache_clear()
         return True
 
+    def _create_index(self) -> None:
+        """Create the empty suggestion index; subclasses swap in their own."""
+        self._index = SymSpellIndex()
+
+    def _index_word(self, word: str) -> None:
+        """Add a new normalized word to the suggestion index."""
+        self._index.add_term(word)
+
     def get_suggestions(self, word: str, max_suggestions: int = 10) -> list[str]:
         """Get spelling suggestions for the given word."""
-        # TODO: Implement proper suggestion algorithm
-        # This is a placeholder implementation using simple edit distance
-        suggestions = []
-        
-        word_lower = word.lower()
-        
-        # Simple suggestions based on exact matches and basic edits
-        for dict_word in self._words:
-            if len(suggestions) >= max_suggestions:
-                break
-            
-            # Check for simple character substitutions
-            if len(word_lower) == len(dict_word):
-                diff_count = sum(1 for a, b in zip(word_lower, dict_word) if a != b)
-                if diff_count == 1:
-                    suggestions.append(dict_word)
-            
-            # Check for insertions/deletions
-            elif abs(len(word_lower) - len(dict_word)) == 1:
-                longer, shorter = (word_lower, dict_word) if len(word_lower) > len(dict_word) else (dict_word, word_lower)
-                for i in range(len(longer)):
-                    if longer[:i] + longer[i+1:] == shorter:
-                        suggestions.append(dict_word)
-                        break
-        
-        return suggestions[:max_suggestions]
+        # Copy so callers cannot mutate the cached list
+        return list(self._cached_suggestions(word.lower(), max_suggestions))
+
+    def _lookup_suggestions(self, word: str, max_suggestions: int) -> list[str]:
+        """Compute suggestions for a lowercased word, bypassing the cache."""
+        return self._index.lookup(word, max_suggestions)
 
     def load_dictionary(self, dictionary_path: str) -> None:
         """Load dictionary from file."""
@@ -92,14 +98,40 @@ class Dictionary(IDictionary):
 class RadixTreeDictionary(Dictionary):
     """Dictionary implementation using RadixTree for efficient lookups."""
 
-    def __init__(self) -> None:
-        """Initialize the RadixTree dictionary."""
-        super().__init__()
-        # TODO: Implement RadixTree data structure
-        # This is a placeholder that inherits from basic Dictionary
-
-    def get_suggestions(self, word: str, max_suggestions: int = 10) -> list[str]:
-        """Get spelling suggestions using RadixTree optimization."""
-        # TODO: Implement RadixTree-based suggestions
-        # For now, use the parent implementation
-        return super().get_suggestions(word, max_suggestions)
\ No newline at end of file
+    def __init__(
+        self, max_edit_distance: int = 2, cache_size: int = 65536, anchor_length: int = 0
+    ) -> None:
+        """Initialize the RadixTree dictionary.
+
+        With ``anchor_length``, suggestions for words of at least four letters
+        are first sought among words sharing their first ``anchor_length``
+        letters, which confines the search to one subtree. While that yields
+        too few suggestions, the anchor is shortened one letter at a time, so
+        errors in the opening letters are still corrected.
+        """
+        super().__init__(cache_size)
+        self._max_edit_distance = max_edit_distance
+        self._anchor_length = anchor_length
+
+    def _create_index(self) -> None:
+        """Create the empty radix tree, in place of the SymSpell index."""
+        self._tree = RadixTree()
+
+    def _index_word(self, word: str) -> None:
+        """Add a new normalized word to the radix tree."""
+        self._tree.insert(word)
+
+    def _lookup_suggestions(self, word: str, max_suggestions: int) -> list[str]:
+        """Compute suggestions for a lowercased word using the radix tree."""
+        anchor_length = self._anchor_length if len(word) >= _MIN_ANCHORED_WORD_LENGTH else 0
+        anchor_length = min(anchor_length, len(word))
+        scored = self._tree.get_scored_suggestions(word, self._max_edit_distance, anchor_length)
+        # Widen the anchor one letter at a time, walking only the subtrees not yet searched
+        for prefix_length in range(anchor_length - 1, -1, -1):
+            if len(scored) >= max_suggestions:
+                break
+            scored += self._tree.get_scored_suggestions(
+                word, self._max_edit_distance, prefix_length, prefix_length + 1
+            )
+        scored.sort()
+        return [suggestion for _, suggestion in scored[:max_suggestions]]
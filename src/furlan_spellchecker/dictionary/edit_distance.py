@@ -0,0 +1,114 @@
+"""Edit distance functions used to rank spelling suggestions.
+
+When the optional ``rapidfuzz`` package is installed its C++ implementation is
+used; otherwise a pure-Python fallback computes the same values.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any, Optional
+
+_rapidfuzz_levenshtein: Any
+_rapidfuzz_process: Any
+try:
+    from rapidfuzz import process as _rapidfuzz_process
+    from rapidfuzz.distance import Levenshtein as _rapidfuzz_levenshtein
+except ImportError:  # pragma: no cover - depends on the installed extras
+    _rapidfuzz_levenshtein = None
+    _rapidfuzz_process = None
+
+
+def levenshtein_distance(word1: str, word2: str, max_distance: Optional[int] = None) -> int:
+    """Return the Levenshtein distance (insertions, deletions, substitutions).
+
+    If ``max_distance`` is given, distances above it are reported as
+    ``max_distance + 1`` so the computation can stop early.
+    """
+    if _rapidfuzz_levenshtein is not None:
+        return int(_rapidfuzz_levenshtein.distance(word1, word2, score_cutoff=max_distance))
+    return _python_levenshtein_distance(word1, word2, max_distance)
+
+
+def levenshtein_neighbours(
+    word: str, candidates: Iterable[str], max_distance: int
+) -> list[tuple[int, str]]:
+    """Return ``(distance, candidate)`` pairs within ``max_distance`` of ``word``.
+
+    With ``rapidfuzz`` the whole batch is scored in a single native call
+    instead of one Python call per candidate.
+    """
+    if _rapidfuzz_process is not None:
+        matches = _rapidfuzz_process.extract(
+            word,
+            candidates,
+            scorer=_rapidfuzz_levenshtein.distance,
+            score_cutoff=max_distance,
+            limit=None,
+        )
+        return [(int(distance), candidate) for candidate, distance, _ in matches]
+
+    neighbours = []
+    for candidate in candidates:
+        distance = _python_levenshtein_distance(word, candidate, max_distance)
+        if distance <= max_distance:
+            neighbours.append((distance, candidate))
+    return neighbours
+
+
+def _python_levenshtein_distance(word1: str, word2: str, max_distance: Optional[int] = None) -> int:
+    """Compute the Levenshtein distance with Myers' bit-parallel algorithm.
+
+    Each column of the dynamic programming matrix is encoded as vertical
+    +1/-1 delta bit vectors held in Python ints (Hyyrö's formulation), so
+    one character of the longer word is processed with a constant number of
+    integer operations regardless of the length of the shorter word.
+    """
+    if word1 == word2:
+        return 0
+    if len(word1) < len(word2):
+        word1, word2 = word2, word1
+    if max_distance is not None and len(word1) - len(word2) > max_distance:
+        return max_distance + 1
+    if not word2:
+        return len(word1)
+
+    # The shorter word is the bit-vector pattern, the longer one is scanned
+    pattern_masks: dict[str, int] = {}
+    for i, char in enumerate(word2):
+        pattern_masks[char] = pattern_masks.get(char, 0) | (1 << i)
+
+    mask = (1 << len(word2)) - 1
+    last_bit = 1 << (len(word2) - 1)
+    positive_vertical = mask
+    negative_vertical = 0
+    distance = len(word2)
+    remaining = len(word1)
+
+    for char in word1:
+        equal = pattern_masks.get(char, 0)
+        vertical_change = equal | negative_vertical
+        horizontal_change = (
+            ((equal & positive_vertical) + positive_vertical) ^ positive_vertical
+        ) | equal
+        positive_horizontal = negative_vertical | ~(horizontal_change | positive_vertical)
+        negative_horizontal = positive_vertical & horizontal_change
+
+        if positive_horizontal & last_bit:
+            distance += 1
+        elif negative_horizontal & last_bit:
+            distance -= 1
+
+        remaining -= 1
+        if max_distance is not None and distance - remaining > max_distance:
+            # Each remaining character can lower the distance by at most one
+            return max_distance + 1
+
+        positive_horizontal = (positive_horizontal << 1) | 1
+        negative_horizontal <<= 1
+        positive_vertical = (negative_horizontal | ~(vertical_change | positive_horizontal)) & mask
+        negative_vertical = positive_horizontal & vertical_change & mask
+
+    if max_distance is not None and distance > max_distance:
+        return max_distance + 1
+    return distance
@@ -2,14 +2,21 @@
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+import os
+from typing import Dict, List, Optional, Tuple
 
 
 class RadixTreeNode:
     """A node in the RadixTree."""
 
-    def __init__(self) -> None:
+    # Trees hold one node per branch point of the whole lexicon, so drop the per-node __dict__
+    __slots__ = ("prefix", "children", "is_end_of_word", "value")
+
+    def __init__(self, prefix: str = "") -> None:
         """Initialize a RadixTree node."""
+        # Label of the compressed edge leading to this node; children are keyed
+        # by the first character of their own label
+        self.prefix = prefix
         self.children: Dict[str, RadixTreeNode] = {}
         self.is_end_of_word = False
         self.value: Optional[str] = None
@@ -21,39 +28,208 @@ class RadixTree:
     def __init__(self) -> None:
         """Initialize the RadixTree."""
         self.root = RadixTreeNode()
+        self._size = 0
 
     def insert(self, word: str) -> None:
         """Insert a word into the RadixTree."""
-        # TODO: Implement RadixTree insertion
-        # This is a placeholder implementation
-        pass
+        node = self.root
+        position = 0
+
+        while position < len(word):
+            child = node.children.get(word[position])
+            if child is None:
+                child = RadixTreeNode(word[position:])
+                node.children[word[position]] = child
+                node = child
+                break
+
+            label = child.prefix
+            if word.startswith(label, position):
+                # Common case: the whole edge matches, checked in one C-level comparison
+                common = len(label)
+            else:
+                common = len(os.path.commonprefix((label, word[position : position + len(label)])))
+
+            if common < len(label):
+                # Split the edge so the shared part becomes its own node
+                split = RadixTreeNode(label[:common])
+                child.prefix = label[common:]
+                split.children[child.prefix[0]] = child
+                node.children[word[position]] = split
+                child = split
+
+            node = child
+            position += common
+
+        if not node.is_end_of_word:
+            node.is_end_of_word = True
+            node.value = word
+            self._size += 1
 
     def search(self, word: str) -> bool:
         """Search for a word in the RadixTree."""
-        # TODO: Implement RadixTree search
-        # This is a placeholder implementation
-        return False
-
-    def starts_with(self, prefix: str) -> List[str]:
-        """Find all words that start with the given prefix."""
-        # TODO: Implement prefix search
-        # This is a placeholder implementation
-        return []
-
-    def get_suggestions(self, word: str, max_distance: int = 2) -> List[str]:
-        """Get word suggestions within edit distance."""
-        # TODO: Implement edit distance based suggestions
-        # This is a placeholder implementation
-        return []
+        node = self._find_node(word)
+        return node is not None and node.is_end_of_word
+
+    def starts_with(self, prefix: str, limit: Optional[int] = None) -> List[str]:
+        """Find all words that start with the given prefix, in sorted order.
+
+        Children are visited in key order, so the walk yields words already
+        sorted and can stop after ``limit`` of them.
+        """
+        node = self.root
+        position = 0
+
+        while position < len(prefix):
+            child = node.children.get(prefix[position])
+            if child is None:
+                return []
+
+            remaining = prefix[position:]
+            if child.prefix.startswith(remaining):
+                node = child
+                break
+            if not remaining.startswith(child.prefix):
+                return []
+
+            node = child
+            position += len(child.prefix)
+
+        words: List[str] = []
+        stack = [node]
+        while stack and (limit is None or len(words) < limit):
+            node = stack.pop()
+            if node.is_end_of_word:
+                assert node.value is not None
+                words.append(node.value)
+            stack.extend(node.children[key] for key in sorted(node.children, reverse=True))
+
+        return words
+
+    def get_suggestions(
+        self, word: str, max_distance: int = 2, prefix_length: int = 0
+    ) -> List[str]:
+        """Get word suggestions within edit distance.
+
+        The tree is walked depth-first while carrying the Levenshtein DP row of
+        ``word`` against the path so far; a subtree is skipped as soon as every
+        cell of the row exceeds ``max_distance``, since extending the path can
+        only keep or raise those costs. With ``prefix_length``, only words that
+        share the first ``prefix_length`` characters of ``word`` are considered,
+        which confines the walk to a single subtree.
+        """
+        return [
+            suggestion
+            for _, suggestion in self.get_scored_suggestions(word, max_distance, prefix_length)
+        ]
+
+    def get_scored_suggestions(
+        self,
+        word: str,
+        max_distance: int = 2,
+        prefix_length: int = 0,
+        excluded_prefix_length: int = 0,
+    ) -> List[Tuple[int, str]]:
+        """Get ``(distance, suggestion)`` pairs within edit distance, closest first.
+
+        Works like :meth:`get_suggestions`. A nonzero ``excluded_prefix_length``
+        additionally skips the subtree of words sharing that many leading
+        characters of ``word``, so an anchored search can be widened without
+        walking the part already searched.
+        """
+        scored: List[Tuple[int, str]] = []
+        first_row = list(range(len(word) + 1))
+        if self.root.is_end_of_word and prefix_length == 0 and 0 < first_row[-1] <= max_distance:
+            assert self.root.value is not None
+            scored.append((first_row[-1], self.root.value))
+
+        prefix_length = min(prefix_length, len(word))
+        excluded_prefix_length = min(excluded_prefix_length, len(word))
+        # Entries carry whether the path so far still spells the start of word
+        stack = [(child, first_row, 0, True) for child in self.root.children.values()]
+        while stack:
+            node, row, depth, on_word = stack.pop()
+
+            for char in node.prefix:
+                if on_word and depth < excluded_prefix_length:
+                    if char != word[depth]:
+                        if depth < prefix_length:
+                            break
+                        on_word = False
+                    elif depth + 1 == excluded_prefix_length:
+                        break
+                elif depth < prefix_length and char != word[depth]:
+                    break
+                depth += 1
+                previous_row = row
+                row = [previous_row[0] + 1]
+                for j, word_char in enumerate(word, 1):
+                    row.append(
+                        min(
+                            row[j - 1] + 1,
+                            previous_row[j] + 1,
+                            previous_row[j - 1] + (word_char != char),
+                        )
+                    )
+                if min(row) > max_distance:
+                    break
+            else:
+                if depth >= prefix_length and node.is_end_of_word and 0 < row[-1] <= max_distance:
+                    assert node.value is not None
+                    scored.append((row[-1], node.value))
+                stack.extend((child, row, depth, on_word) for child in node.children.values())
+
+        scored.sort()
+        return scored
 
     def delete(self, word: str) -> bool:
         """Delete a word from the RadixTree."""
-        # TODO: Implement RadixTree deletion
-        # This is a placeholder implementation
-        return False
+        path = [self.root]
+        position = 0
+
+        while position < len(word):
+            child = path[-1].children.get(word[position])
+            if child is None or not word.startswith(child.prefix, position):
+                return False
+            path.append(child)
+            position += len(child.prefix)
+
+        node = path[-1]
+        if not node.is_end_of_word:
+            return False
+
+        node.is_end_of_word = False
+        node.value = None
+        self._size -= 1
+
+        # Drop the emptied leaf, then merge a parent left with a single child
+        if node is not self.root and not node.children:
+            parent = path[-2]
+            del parent.children[node.prefix[0]]
+            node = parent
+            path.pop()
+
+        if node is not self.root and not node.is_end_of_word and len(node.children) == 1:
+            (child,) = node.children.values()
+            child.prefix = node.prefix + child.prefix
+            path[-2].children[child.prefix[0]] = child
+
+        return True
 
     def size(self) -> int:
         """Get the number of words in the RadixTree."""
-        # TODO: Implement size calculation
-        # This is a placeholder implementation
-        return 0
\ No newline at end of file
+        return self._size
+
+    def _find_node(self, word: str) -> Optional[RadixTreeNode]:
+        """Return the node reached by following exactly ``word``, if any."""
+        node = self.root
+        position = 0
+
+        while position < len(word):
+            child = node.children.get(word[position])
+            if child is None or not word.startswith(child.prefix, position):
+                return None
+            node = child
+            position += len(child.prefix)
+
+        return node
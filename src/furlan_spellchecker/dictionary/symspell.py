@@ -0,0 +1,75 @@
+"""SymSpell delete-neighbourhood index for edit-distance suggestions."""
+
+from __future__ import annotations
+
+from typing import Union
+
+from .edit_distance import levenshtein_neighbours
+
+
+class SymSpellIndex:
+    """Index mapping every deletion variant of a term back to the term.
+
+    Two words within edit distance ``n`` share at least one variant obtained by
+    deleting at most ``n`` characters from each of them, so suggestion candidates
+    are found with a handful of hash lookups instead of a scan of the dictionary.
+    """
+
+    def __init__(self, max_edit_distance: int = 1) -> None:
+        """Initialize an empty index."""
+        if max_edit_distance < 1:
+            raise ValueError("max_edit_distance must be at least 1")
+
+        self._max_edit_distance = max_edit_distance
+        # Almost every variant belongs to a single term, which is then stored
+        # directly instead of in a one-element list
+        self._deletes: dict[str, Union[str, list[str]]] = {}
+        self._longest_term = 0
+
+    def add_term(self, term: str) -> None:
+        """Index a term; callers must not add the same term twice."""
+        self._longest_term = max(self._longest_term, len(term))
+        deletes = self._deletes
+        for variant in self._deletion_variants(term):
+            terms = deletes.get(variant)
+            if terms is None:
+                deletes[variant] = term
+            elif isinstance(terms, str):
+                deletes[variant] = [terms, term]
+            else:
+                terms.append(term)
+
+    def lookup(self, word: str, max_suggestions: int = 10) -> list[str]:
+        """Get indexed terms within the edit distance, closest first."""
+        if len(word) - self._max_edit_distance > self._longest_term:
+            # No term is close enough; also spares building the variants of a
+            # long input, whose number grows with the square of its length
+            return []
+
+        candidates: set[str] = set()
+        for variant in self._deletion_variants(word):
+            terms = self._deletes.get(variant)
+            if terms is None:
+                continue
+            if isinstance(terms, str):
+                candidates.add(terms)
+            else:
+                candidates.update(terms)
+
+        candidates.discard(word)
+        scored = levenshtein_neighbours(word, candidates, self._max_edit_distance)
+        scored.sort()
+        return [term for _, term in scored[:max_suggestions]]
+
+    def _deletion_variants(self, word: str) -> set[str]:
+        """Get the word and every string reachable by deleting up to N characters."""
+        variants = {word}
+        frontier = {word}
+        for _ in range(self._max_edit_distance):
+            frontier = {
+                variant[:i] + variant[i + 1 :]
+                for variant in frontier
+                for i in range(len(variant))
+            }
+            variants |= frontier
+        return variants
@@ -3,8 +3,16 @@
 from __future__ import annotations
 
 import json
+import os
+import secrets
+import stat
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, TextIO, cast
+
+# Buffer size for streamed text files; large buffers keep syscalls rare on big inputs
+STREAM_BUFFER_SIZE = 1 << 20
 
 
 class IOService:
@@ -27,11 +35,66 @@ class IOService:
         path.parent.mkdir(parents=True, exist_ok=True)
         path.write_text(content, encoding=encoding)
 
+    @staticmethod
+    def iter_text_lines(file_path: str, encoding: str = "utf-8") -> Iterator[str]:
+        """Yield the lines of a text file without reading the whole file."""
+        path = Path(file_path)
+        
+        if not path.exists():
+            raise FileNotFoundError(f"File not found: {file_path}")
+            
+        with path.open("r", encoding=encoding, buffering=STREAM_BUFFER_SIZE) as file:
+            yield from file
+
+    @staticmethod
+    @contextmanager
+    def open_text_writer(file_path: str, encoding: str = "utf-8") -> Iterator[TextIO]:
+        """Open a text file for incremental writing, creating parent directories.
+
+        Text goes to a temporary file next to the target, which replaces the
+        target only when the block completes; on error the target is untouched.
+        """
+        path = Path(file_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(f".{path.name}.{secrets.token_hex(4)}.tmp")
+
+        try:
+            with temp_path.open("x", encoding=encoding, buffering=STREAM_BUFFER_SIZE) as file:
+                yield file
+            try:
+                # Keep the permissions of a file being overwritten
+                os.chmod(temp_path, stat.S_IMODE(os.stat(path).st_mode))
+            except FileNotFoundError:
+                pass
+            os.replace(temp_path, path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+
     @staticmethod
     def read_json_file(file_path: str, encoding: str = "utf-8") -> Dict[str, Any]:
-        """Read JSON data from a file."""
-        content = IOService.read_text_file(file_path, encoding)
-        return json.loads(content)
+        """Read JSON data from a file, parsing with orjson when it is installed.
+
+        orjson is stricter than json: it rejects NaN/Infinity literals and lone
+        surrogate escapes. Input it refuses is parsed again with json, so the
+        result never depends on whether orjson is installed.
+        """
+        try:
+            import orjson
+        except ImportError:
+            return cast(Dict[str, Any], json.loads(IOService.read_text_file(file_path, encoding)))
+
+        if encoding.lower().replace("_", "-") not in ("utf-8", "utf8"):
+            return cast(Dict[str, Any], json.loads(IOService.read_text_file(file_path, encoding)))
+
+        # orjson parses UTF-8 bytes directly, skipping the decode to str
+        path = Path(file_path)
+        if not path.exists():
+            raise FileNotFoundError(f"File not found: {file_path}")
+        try:
+            return cast(Dict[str, Any], orjson.loads(path.read_bytes()))
+        except orjson.JSONDecodeError:
+            return cast(Dict[str, Any], json.loads(IOService.read_text_file(file_path, encoding)))
 
     @staticmethod
     def write_json_file(
@@ -40,9 +103,13 @@ class IOService:
         encoding: str = "utf-8",
         indent: int = 2
     ) -> None:
-        """Write JSON data to a file."""
-        content = json.dumps(data, ensure_ascii=False, indent=indent)
-        IOService.write_text_file(file_path, content, encoding)
+        """Write JSON data to a file, streaming it instead of building one string.
+
+        The target is replaced only once serialization succeeds, so a value
+        json cannot encode leaves any existing file intact.
+        """
+        with IOService.open_text_writer(file_path, encoding) as file:
+            json.dump(data, file, ensure_ascii=False, indent=indent)
 
     @staticmethod
     def read_word_list(file_path: str, encoding: str = "utf-8") -> list[str]:
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator
+from typing import Any
+
 from ..core.interfaces import ISpellChecker, IDictionary
 from ..spellchecker import FurlanSpellChecker, TextProcessor
 from ..dictionary import Dictionary
@@ -51,6 +54,11 @@ class SpellCheckPipeline:
             "incorrect_count": len(incorrect_words),
         }
 
+    def check_text_stream(self, lines: Iterable[str]) -> Iterator[dict[str, Any]]:
+        """Check text line by line, yielding the check_text result of each line."""
+        for line in lines:
+            yield self.check_text(line.rstrip("\r\n"))
+
     async def check_word(self, word: str) -> dict:
         """Check a single word and return results."""
         processed_word = ProcessedWord(word)
@@ -69,10 +77,34 @@ class SpellCheckPipeline:
             
         return result
 
+    def check_word_sync(self, word: str) -> dict[str, Any]:
+        """Check a single word without an event loop and return results."""
+        processed_word = ProcessedWord(word)
+        is_correct = self._spell_checker.check_word_sync(processed_word)
+        
+        result = {
+            "word": word,
+            "is_correct": is_correct,
+            "case": processed_word.case.value,
+            "suggestions": [],
+        }
+        
+        if not is_correct:
+            suggestions = self._spell_checker.get_word_suggestions_sync(processed_word)
+            result["suggestions"] = suggestions
+            
+        return result
+
     async def get_suggestions(self, word: str, max_suggestions: int = 10) -> list[str]:
         """Get spelling suggestions for a word."""
         processed_word = ProcessedWord(word)
-        return await self._spell_checker.get_word_suggestions(processed_word)
+        suggestions = await self._spell_checker.get_word_suggestions(processed_word)
+        return suggestions[:max_suggestions]
+
+    def get_suggestions_sync(self, word: str, max_suggestions: int = 10) -> list[str]:
+        """Get spelling suggestions for a word without an event loop."""
+        processed_word = ProcessedWord(word)
+        return self._spell_checker.get_word_suggestions_sync(processed_word, max_suggestions)
 
     def add_word_to_dictionary(self, word: str) -> bool:
         """Add a word to the dictionary."""
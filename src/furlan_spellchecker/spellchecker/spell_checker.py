@@ -46,6 +46,10 @@ class FurlanSpellChecker(ISpellChecker):
 
     async def check_word(self, word: ProcessedWord) -> bool:
         """Check if the given word is correct."""
+        return self.check_word_sync(word)
+
+    def check_word_sync(self, word: ProcessedWord) -> bool:
+        """Check if the given word is correct without an event loop."""
         # TODO: Implement word checking logic
         is_correct = self._dictionary.contains_word(word.current.lower())
         word.checked = True
@@ -54,10 +58,16 @@ class FurlanSpellChecker(ISpellChecker):
 
     async def get_word_suggestions(self, word: ProcessedWord) -> list[str]:
         """Get suggestions for the given word."""
+        return self.get_word_suggestions_sync(word)
+
+    def get_word_suggestions_sync(
+        self, word: ProcessedWord, max_suggestions: int = 10
+    ) -> list[str]:
+        """Get up to ``max_suggestions`` suggestions for the word without an event loop."""
         # TODO: Implement suggestion logic
         if word.correct:
             return []
-        return self._dictionary.get_suggestions(word.current)
+        return self._dictionary.get_suggestions(word.current, max_suggestions)
 
     def swap_word_with_suggested(self, original_word: ProcessedWord, suggested_word: str) -> None:
         """Replace the original word with the suggested one."""
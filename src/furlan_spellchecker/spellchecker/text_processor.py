@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Iterator
 from typing import List
 
 from ..core.interfaces import ITextProcessor
 from ..entities.processed_element import IProcessedElement, ProcessedWord, ProcessedPunctuation
 
+# Compiled once at import; a token is a word or a single punctuation character
+_TOKEN_PATTERN = re.compile(r"(?P<word>\w+)|(?P<punctuation>[^\w\s])")
+_WORD_PATTERN = re.compile(r"\b\w+\b")
+_PUNCTUATION_PATTERN = re.compile(r"[^\w\s]")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+# A word with its elisions kept together (l'aghe, d’invier); combining accents
+# are included so decomposed (NFD) input is not split mid-letter
+_ELIDED_WORD_PATTERN = re.compile(r"[\w\u0300-\u036f]+(?:['\u2019][\w\u0300-\u036f]+)*")
+
 
 class TextProcessor(ITextProcessor):
     """Implementation of text processing functionality."""
@@ -15,40 +25,34 @@ class TextProcessor(ITextProcessor):
     def __init__(self) -> None:
         """Initialize the text processor."""
         # TODO: Define better tokenization patterns
-        self._word_pattern = re.compile(r"\b\w+\b")
-        self._punctuation_pattern = re.compile(r"[^\w\s]")
-        self._whitespace_pattern = re.compile(r"\s+")
+        self._word_pattern = _WORD_PATTERN
+        self._punctuation_pattern = _PUNCTUATION_PATTERN
+        self._whitespace_pattern = _WHITESPACE_PATTERN
 
     def process_text(self, text: str) -> list[IProcessedElement]:
         """Process text into a list of processed elements."""
         elements: list[IProcessedElement] = []
         
         # TODO: Implement proper tokenization that preserves order and whitespace
-        # This is a simplified implementation
-        tokens = self.split_into_tokens(text)
-        
-        for token in tokens:
-            if self.is_word(token):
-                elements.append(ProcessedWord(token))
-            elif self.is_punctuation(token):
-                elements.append(ProcessedPunctuation(token))
-            # Skip whitespace for now
+        # This is a simplified implementation; whitespace is skipped for now
+        for match in _TOKEN_PATTERN.finditer(text):
+            if match.lastgroup == "word":
+                elements.append(ProcessedWord(match.group()))
+            else:
+                elements.append(ProcessedPunctuation(match.group()))
         
         return elements
 
     def split_into_tokens(self, text: str) -> list[str]:
         """Split text into tokens."""
         # TODO: Implement proper tokenization that handles Friulian text
-        # This is a simplified implementation using regex
-        tokens = []
-        
-        # Find all words and punctuation
-        for match in re.finditer(r"\w+|[^\w\s]|\s+", text):
-            token = match.group()
-            if token.strip():  # Skip pure whitespace for now
-                tokens.append(token)
-        
-        return tokens
+        # Words and punctuation are kept, pure whitespace is skipped for now
+        return [match.group() for match in _TOKEN_PATTERN.finditer(text)]
+
+    def iter_words(self, text: str) -> Iterator[str]:
+        """Lazily yield the words of a text, keeping elided forms as one word."""
+        for match in _ELIDED_WORD_PATTERN.finditer(text):
+            yield match.group()
 
     def is_word(self, token: str) -> bool:
         """Check if a token is a word."""
@@ -56,4 +60,4 @@ class TextProcessor(ITextProcessor):
 
     def is_punctuation(self, token: str) -> bool:
         """Check if a token is punctuation."""
-        return bool(self._punctuation_pattern.match(token)) and not token.isspace()
\ No newline at end of file
+        return bool(self._punctuation_pattern.match(token)) and not token.isspace()
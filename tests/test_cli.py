@@ -0,0 +1,235 @@
+"""Test the command-line interface."""
+
+import io
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+
+import pytest
+from click.testing import CliRunner
+
+from furlan_spellchecker.cli import app
+from furlan_spellchecker.cli.app import main
+
+
+@pytest.fixture
+def runner():
+    """Create a Click test runner."""
+    return CliRunner()
+
+
+@pytest.fixture
+def dictionary_file(tmp_path):
+    """Create a small dictionary file."""
+    dict_file = tmp_path / "dict.txt"
+    dict_file.write_text("cjase\nfradi\nsûr\n", encoding="utf-8")
+    return dict_file
+
+
+class TestCLI:
+    """Test CLI commands."""
+
+    def test_lookup_correct_word(self, runner, dictionary_file):
+        """Test looking up a word that is in the dictionary."""
+        result = runner.invoke(main, ["lookup", "cjase", "-d", str(dictionary_file)])
+
+        assert result.exit_code == 0
+        assert "'cjase' is correct" in result.output
+
+    def test_suggest(self, runner, dictionary_file):
+        """Test getting suggestions for a misspelled word."""
+        result = runner.invoke(main, ["suggest", "cjasa", "-d", str(dictionary_file)])
+
+        assert result.exit_code == 0
+        assert "cjase" in result.output
+
+    def test_dictionary_reused_for_same_dictionary(self, dictionary_file):
+        """Test that the loaded dictionary, but not the pipeline, is shared."""
+        app._load_dictionary.cache_clear()
+
+        first = app._get_pipeline(str(dictionary_file))
+        second = app._get_pipeline(str(dictionary_file))
+
+        assert first is not second
+        assert first._dictionary is second._dictionary
+        assert app._load_dictionary.cache_info().hits == 1
+
+        first.check_text("cjasa")
+        assert second._spell_checker.processed_elements == []
+
+    def test_pipeline_reloaded_when_dictionary_changes(self, dictionary_file):
+        """Test that rewriting the dictionary file invalidates the cache."""
+        app._load_dictionary.cache_clear()
+        first = app._get_pipeline(str(dictionary_file))
+
+        stat = dictionary_file.stat()
+        with dictionary_file.open("a", encoding="utf-8") as file:
+            file.write("gjat\n")
+        os.utime(dictionary_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        second = app._get_pipeline(str(dictionary_file))
+        assert second._dictionary is not first._dictionary
+        assert second.check_word_sync("gjat")["is_correct"]
+
+    def test_serve_stdin(self, runner, dictionary_file):
+        """Test answering several requests from one serve session."""
+        requests = "LOOKUP cjase\nLOOKUP cjasa\nSUGGEST cjasa 3\nFOO bar\nQUIT\nLOOKUP fradi\n"
+        result = runner.invoke(main, ["serve", "-d", str(dictionary_file)], input=requests)
+
+        assert result.exit_code == 0
+        assert result.output.splitlines() == [
+            "ok",
+            "no\tcjase",
+            "cjase",
+            "error\tunknown command FOO",
+        ]
+
+    def test_serve_rejects_non_positive_count(self, runner, dictionary_file):
+        """Test that SUGGEST counts below one are reported as errors."""
+        requests = "SUGGEST cjasa 0\nSUGGEST cjasa -2\nSUGGEST cjasa 1\n"
+        result = runner.invoke(main, ["serve", "-d", str(dictionary_file)], input=requests)
+
+        assert result.exit_code == 0
+        assert result.output.splitlines() == [
+            "error\tsuggestion count must be at least 1, got 0",
+            "error\tsuggestion count must be at least 1, got -2",
+            "cjase",
+        ]
+
+    def test_serve_stream(self, dictionary_file):
+        """Test serving requests from an in-memory stream."""
+        reader = io.StringIO("CHECK cjase fradi\n\nLOOKUP cjasa\nQUIT\nCHECK cjase\n")
+        writer = io.StringIO()
+
+        app._serve_stream(app._get_pipeline(str(dictionary_file)), reader, writer)
+
+        assert writer.getvalue() == "ok\nno\tcjase\n"
+
+    @pytest.mark.skipif(
+        sys.platform == "win32" or not hasattr(socketserver, "ThreadingUnixStreamServer"),
+        reason="requires UNIX domain sockets",
+    )
+    def test_serve_socket_round_trip(self, dictionary_file, tmp_path):
+        """Test answering requests over a UNIX domain socket."""
+        socket_path = str(tmp_path / "serve.sock")
+        server = app._make_unix_server(socket_path, str(dictionary_file))
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+                client.connect(socket_path)
+                client.sendall(b"LOOKUP cjasa\nCHECK cjase\nQUIT\n")
+                with client.makefile("r", encoding="utf-8") as responses:
+                    assert responses.read().splitlines() == ["no\tcjase", "ok"]
+        finally:
+            server.shutdown()
+            server.server_close()
+            thread.join()
+
+    @pytest.mark.skipif(
+        sys.platform == "win32" or not hasattr(socketserver, "ThreadingUnixStreamServer"),
+        reason="requires UNIX domain sockets",
+    )
+    def test_serve_socket_in_use(self, runner, dictionary_file, tmp_path):
+        """Test that a live server's socket is kept and a stale one removed."""
+        socket_path = str(tmp_path / "serve.sock")
+        server = app._make_unix_server(socket_path, str(dictionary_file))
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        try:
+            result = runner.invoke(
+                main, ["serve", "-d", str(dictionary_file), "--socket", socket_path]
+            )
+            assert result.exit_code == 2
+            assert "in use" in result.output
+            assert os.path.exists(socket_path)
+        finally:
+            server.shutdown()
+            server.server_close()
+            thread.join()
+
+        app._remove_stale_socket(socket_path)
+        assert not os.path.exists(socket_path)
+
+    def test_file_to_output(self, runner, dictionary_file, tmp_path):
+        """Test checking a file line by line into an output file."""
+        input_file = tmp_path / "input.txt"
+        input_file.write_text("cjase fradi\nsûr\n", encoding="utf-8")
+        output_file = tmp_path / "out" / "corrected.txt"
+
+        result = runner.invoke(
+            main, ["file", str(input_file), "-o", str(output_file), "-d", str(dictionary_file)]
+        )
+
+        assert result.exit_code == 0
+        assert "Total words: 3" in result.output
+        assert output_file.read_text(encoding="utf-8") == "cjasefradi\nsûr\n"
+
+    def test_file_output_onto_input_is_rejected(self, runner, dictionary_file, tmp_path):
+        """Test that writing the output over the input file is refused."""
+        input_file = tmp_path / "input.txt"
+        input_file.write_text("cjase fradi\nsûr\n", encoding="utf-8")
+
+        result = runner.invoke(
+            main, ["file", str(input_file), "-o", str(input_file), "-d", str(dictionary_file)]
+        )
+
+        assert result.exit_code == 2
+        assert "must not be the input file" in result.output
+        assert input_file.read_text(encoding="utf-8") == "cjase fradi\nsûr\n"
+
+    def test_file_to_stdout_in_batches(self, runner, dictionary_file, tmp_path):
+        """Test that batched stdout output keeps line order ahead of the summary."""
+        input_file = tmp_path / "input.txt"
+        input_file.write_text("".join(f"cjase{i}\n" for i in range(2500)), encoding="utf-8")
+
+        result = runner.invoke(main, ["file", str(input_file), "-d", str(dictionary_file)])
+
+        assert result.exit_code == 0
+        lines = result.output.splitlines()
+        assert lines[1:2501] == [f"cjase{i}" for i in range(2500)]
+        assert lines[2502] == "Summary:"
+
+    def test_file_to_stdout(self, runner, dictionary_file, tmp_path):
+        """Test checking a file and printing the corrected text."""
+        input_file = tmp_path / "input.txt"
+        input_file.write_text("cjase\nfradi\n", encoding="utf-8")
+
+        result = runner.invoke(main, ["file", str(input_file), "-d", str(dictionary_file)])
+
+        assert result.exit_code == 0
+        assert result.output.startswith("Corrected text:\ncjase\nfradi\n")
+        assert "Total words: 2" in result.output
+
+    def test_check_json_output(self, runner, dictionary_file, monkeypatch):
+        """Test that JSON output is the same with and without orjson."""
+        args = ["check", "cjase sûr", "-f", "json", "-d", str(dictionary_file)]
+        result = runner.invoke(main, args)
+
+        monkeypatch.setitem(sys.modules, "orjson", None)
+        fallback = runner.invoke(main, args)
+
+        assert result.exit_code == 0
+        assert json.loads(result.output)["original_text"] == "cjase sûr"
+        assert result.output == fallback.output
+
+    def test_format_text_result(self):
+        """Test formatting a result as text."""
+        result = {
+            "original_text": "cjasa",
+            "processed_text": "cjasa",
+            "total_words": 1,
+            "incorrect_count": 1,
+            "incorrect_words": [
+                {"original": "cjasa", "current": "cjasa", "suggestions": ["cjase"], "case": "lowercase"}
+            ],
+        }
+
+        text = app._format_text_result(result)
+
+        assert "Total words: 1" in text
+        assert "  - cjasa (case: lowercase)" in text
+        assert "    Suggestions: cjase" in text
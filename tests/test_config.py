@@ -0,0 +1,36 @@
+"""Test configuration schemas."""
+
+import pytest
+
+from furlan_spellchecker.config import FurlanSpellCheckerConfig
+
+
+class TestFurlanSpellCheckerConfig:
+    """Test FurlanSpellCheckerConfig functionality."""
+
+    def test_to_dict(self):
+        """Test that every section and field is serialized."""
+        data = FurlanSpellCheckerConfig().to_dict()
+
+        assert list(data) == ["dictionary", "spell_checker", "text_processing", "phonetic"]
+        assert data["dictionary"]["max_suggestions"] == 10
+        assert data["spell_checker"]["min_word_length"] == 2
+        assert data["text_processing"]["custom_tokenization_rules"] == {}
+        assert data["phonetic"]["similarity_threshold"] == 0.8
+
+    def test_dict_round_trip(self):
+        """Test that from_dict restores what to_dict produced."""
+        config = FurlanSpellCheckerConfig.from_dict(
+            {"dictionary": {"max_suggestions": 3}, "phonetic": {"custom_rules": {"ch": "k"}}}
+        )
+
+        assert FurlanSpellCheckerConfig.from_dict(config.to_dict()) == config
+        assert config.to_dict()["phonetic"]["custom_rules"] == {"ch": "k"}
+
+    def test_configs_use_slots(self):
+        """Test that config instances reject unknown attributes."""
+        config = FurlanSpellCheckerConfig()
+
+        assert not hasattr(config, "__dict__")
+        with pytest.raises(AttributeError):
+            config.dictionary.max_suggestion = 5
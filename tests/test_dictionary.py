@@ -2,7 +2,16 @@
 
 import pytest
 from pathlib import Path
-from furlan_spellchecker.dictionary import Dictionary
+from hypothesis import given, strategies as st
+from furlan_spellchecker.dictionary import (
+    Dictionary,
+    RadixTreeDictionary,
+    SymSpellIndex,
+    levenshtein_distance,
+    levenshtein_neighbours,
+)
+from furlan_spellchecker.dictionary import edit_distance
+from furlan_spellchecker.dictionary.edit_distance import _python_levenshtein_distance
 from furlan_spellchecker.core.exceptions import DictionaryNotFoundError, DictionaryLoadError
 
 
@@ -81,6 +90,16 @@ class TestDictionary:
         assert isinstance(suggestions, list)
         assert len(suggestions) <= 3
 
+    def test_suggestions_within_one_edit_sorted(self):
+        """Test that suggestions are within one edit and ordered."""
+        dictionary = Dictionary()
+        for word in ["cjase", "cjases", "cjasis", "casa", "case"]:
+            dictionary.add_word(word)
+
+        assert dictionary.get_suggestions("cjasa") == ["casa", "cjase"]
+        assert dictionary.get_suggestions("CJASA", max_suggestions=1) == ["casa"]
+        assert dictionary.get_suggestions("cjase") == ["case", "cjases"]
+
     def test_load_dictionary_file_not_found(self):
         """Test loading non-existent dictionary file."""
         dictionary = Dictionary()
@@ -127,4 +146,163 @@ pari
         
         # Adding same word shouldn't increase count
         dictionary.add_word("first")
-        assert dictionary.word_count == 2
\ No newline at end of file
+        assert dictionary.word_count == 2
+
+    def test_suggestion_cache(self):
+        """Test that suggestions are cached and invalidated by new words."""
+        dictionary = Dictionary()
+        dictionary.add_word("cjase")
+
+        first = dictionary.get_suggestions("Cjasa")
+        first.append("mutated")
+        assert dictionary.get_suggestions("cjasa") == ["cjase"]
+        assert dictionary._cached_suggestions.cache_info().hits == 1
+
+        dictionary.add_word("cjasa")
+        dictionary.add_word("cjasi")
+        assert dictionary.get_suggestions("cjasa") == ["cjase", "cjasi"]
+
+
+class TestRadixTreeDictionary:
+    """Test RadixTreeDictionary functionality."""
+
+    def test_words_and_suggestions(self):
+        """Test lookups and suggestions backed by the radix tree."""
+        dictionary = RadixTreeDictionary()
+        for word in ["Cjase", "case", "cjases", "fradi"]:
+            dictionary.add_word(word)
+
+        assert dictionary.word_count == 4
+        assert dictionary.contains_word("CJASE")
+        assert dictionary.get_suggestions("cjasa") == ["cjase", "case", "cjases"]
+        assert dictionary.get_suggestions("cjasa", max_suggestions=1) == ["cjase"]
+        assert not hasattr(dictionary, "_index")
+
+    def test_anchored_suggestions(self):
+        """Test that anchoring keeps the opening letters of longer words."""
+        dictionary = RadixTreeDictionary(anchor_length=2)
+        for word in ["cjase", "case", "cjases", "fradi", "sun", "fun"]:
+            dictionary.add_word(word)
+
+        assert dictionary.get_suggestions("cjasa", max_suggestions=2) == ["cjase", "cjases"]
+        assert dictionary.get_suggestions("cjasa") == ["cjase", "case", "cjases"]
+        assert dictionary.get_suggestions("gun") == ["fun", "sun"]
+
+    def test_widened_suggestions_ranked_by_distance(self):
+        """Test that suggestions from a shorter anchor are merged by distance."""
+        dictionary = RadixTreeDictionary(anchor_length=2)
+        for word in ["cjasis", "cuasa", "fjasa"]:
+            dictionary.add_word(word)
+
+        assert dictionary.get_suggestions("cjasa", max_suggestions=1) == ["cjasis"]
+        assert dictionary.get_suggestions("cjasa", max_suggestions=2) == ["cuasa", "cjasis"]
+        assert dictionary.get_suggestions("cjasa") == ["cuasa", "fjasa", "cjasis"]
+
+    def test_anchored_suggestions_fix_first_letter(self):
+        """Test that a wrong first letter still finds the intended word."""
+        dictionary = RadixTreeDictionary(anchor_length=1)
+        for word in ["cjase", "fradi"]:
+            dictionary.add_word(word)
+
+        assert dictionary.get_suggestions("xjase") == ["cjase"]
+
+
+class TestSymSpellIndex:
+    """Test SymSpellIndex functionality."""
+
+    def test_lookup_edit_operations(self):
+        """Test substitutions, insertions and deletions are found."""
+        index = SymSpellIndex()
+        for term in ["cjase", "fradi", "pan"]:
+            index.add_term(term)
+
+        assert index.lookup("cjasa") == ["cjase"]  # substitution
+        assert index.lookup("fradii") == ["fradi"]  # insertion
+        assert index.lookup("pa") == ["pan"]  # deletion
+        assert index.lookup("fdari") == []  # transposition is two edits
+        assert index.lookup("cjase") == []  # exact match is not a suggestion
+
+    def test_lookup_larger_distance(self):
+        """Test lookups with a larger maximum edit distance."""
+        index = SymSpellIndex(max_edit_distance=2)
+        for term in ["cjase", "cjasis", "case"]:
+            index.add_term(term)
+
+        assert index.lookup("cjasa") == ["cjase", "case", "cjasis"]
+
+    def test_lookup_skips_words_longer_than_any_term(self, monkeypatch):
+        """Test that overlong words are rejected before building deletion variants."""
+        index = SymSpellIndex(max_edit_distance=2)
+        for term in ["cjase", "fradi"]:
+            index.add_term(term)
+
+        assert index.lookup("fradiii") == ["fradi"]
+
+        def fail(word):
+            raise AssertionError("deletion variants built for an overlong word")
+
+        monkeypatch.setattr(index, "_deletion_variants", fail)
+        assert index.lookup("fradiiii") == []
+        assert index.lookup("a" * 20000) == []
+
+    def test_invalid_distance(self):
+        """Test that the edit distance must be positive."""
+        with pytest.raises(ValueError):
+            SymSpellIndex(max_edit_distance=0)
+
+
+@pytest.mark.parametrize("distance", [levenshtein_distance, _python_levenshtein_distance])
+def test_levenshtein_distance(distance):
+    """Test the Levenshtein distance."""
+    assert distance("", "") == 0
+    assert distance("cjase", "") == 5
+    assert distance("cjase", "cjase") == 0
+    assert distance("cjase", "case") == 1
+    assert distance("kitten", "sitting") == 3
+    assert distance("sûr", "sur") == 1
+
+
+@pytest.mark.parametrize("distance", [levenshtein_distance, _python_levenshtein_distance])
+def test_levenshtein_distance_cutoff(distance):
+    """Test that distances above the cutoff are capped."""
+    assert distance("kitten", "sitting", 3) == 3
+    assert distance("kitten", "sitting", 2) == 3
+    assert distance("kitten", "sitting", 1) == 2
+    assert distance("cjase", "c", 1) == 2
+
+
+@pytest.mark.parametrize("use_rapidfuzz", [True, False])
+def test_levenshtein_neighbours(monkeypatch, use_rapidfuzz):
+    """Test batch scoring of candidates with and without rapidfuzz."""
+    if not use_rapidfuzz:
+        monkeypatch.setattr(edit_distance, "_rapidfuzz_process", None)
+
+    neighbours = levenshtein_neighbours("cjase", ["case", "cjases", "cjan", "cjase"], 1)
+    assert sorted(neighbours) == [(0, "cjase"), (1, "case"), (1, "cjases")]
+
+
+def _reference_levenshtein(word1, word2):
+    """Compute the Levenshtein distance with the full dynamic programming matrix."""
+    rows = [[max(i, j) if i * j == 0 else 0 for j in range(len(word2) + 1)]
+            for i in range(len(word1) + 1)]
+    for i in range(1, len(word1) + 1):
+        for j in range(1, len(word2) + 1):
+            rows[i][j] = min(
+                rows[i - 1][j] + 1,
+                rows[i][j - 1] + 1,
+                rows[i - 1][j - 1] + (word1[i - 1] != word2[j - 1]),
+            )
+    return rows[-1][-1]
+
+
+_friulian_words = st.text(alphabet="acegijlnrsu\u00e2\u00e7\u00ea", max_size=80)
+
+
+@given(_friulian_words, _friulian_words, st.one_of(st.none(), st.integers(0, 5)))
+def test_bit_parallel_levenshtein_matches_reference(word1, word2, max_distance):
+    """Test the bit-parallel distance against the textbook dynamic program."""
+    expected = _reference_levenshtein(word1, word2)
+    if max_distance is not None:
+        expected = min(expected, max_distance + 1)
+
+    assert _python_levenshtein_distance(word1, word2, max_distance) == expected
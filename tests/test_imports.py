@@ -57,4 +57,31 @@ def test_core_interfaces_exist():
     assert hasattr(IDictionary, "contains_word")
     assert hasattr(IDictionary, "add_word")
     assert hasattr(IPhoneticAlgorithm, "get_phonetic_code")
-    assert hasattr(ITextProcessor, "process_text")
\ No newline at end of file
+    assert hasattr(ITextProcessor, "process_text")
+
+
+def test_package_import_is_lazy():
+    """Test that importing the package does not load the submodules eagerly."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, furlan_spellchecker; "
+        "print('furlan_spellchecker.services' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
+
+
+def test_lazy_attribute_access():
+    """Test that lazily exported names resolve and unknown names raise."""
+    import furlan_spellchecker
+    from furlan_spellchecker.services import SpellCheckPipeline
+
+    assert furlan_spellchecker.SpellCheckPipeline is SpellCheckPipeline
+    assert "SpellCheckPipeline" in dir(furlan_spellchecker)
+
+    with pytest.raises(AttributeError):
+        _ = furlan_spellchecker.DoesNotExist
@@ -0,0 +1,110 @@
+"""Test IOService functionality."""
+
+import json
+import sys
+
+import pytest
+
+from furlan_spellchecker.services import IOService
+
+
+class TestIOService:
+    """Test IOService functionality."""
+
+    def test_text_round_trip(self, tmp_path):
+        """Test writing and reading a text file."""
+        file_path = tmp_path / "nested" / "text.txt"
+
+        IOService.write_text_file(str(file_path), "Cheste e je une frâs.\n")
+
+        assert IOService.read_text_file(str(file_path)) == "Cheste e je une frâs.\n"
+
+    def test_read_translates_newlines(self, tmp_path):
+        """Test that reading matches text-mode newline translation."""
+        file_path = tmp_path / "text.txt"
+        file_path.write_bytes("cjase\r\nsûr\rfradi\n\r\n".encode("utf-8"))
+
+        assert IOService.read_text_file(str(file_path)) == "cjase\nsûr\nfradi\n\n"
+        assert IOService.read_text_file(str(file_path)) == file_path.read_text(encoding="utf-8")
+
+    def test_read_empty_file(self, tmp_path):
+        """Test reading an empty file."""
+        file_path = tmp_path / "empty.txt"
+        file_path.write_bytes(b"")
+
+        assert IOService.read_text_file(str(file_path)) == ""
+
+    def test_text_writer_replaces_only_on_success(self, tmp_path):
+        """Test that a failed write leaves the existing file and no temp file."""
+        file_path = tmp_path / "text.txt"
+        file_path.write_text("old\n", encoding="utf-8")
+
+        with pytest.raises(RuntimeError):
+            with IOService.open_text_writer(str(file_path)) as file:
+                file.write("partial\n")
+                raise RuntimeError("boom")
+
+        assert file_path.read_text(encoding="utf-8") == "old\n"
+        assert list(tmp_path.iterdir()) == [file_path]
+
+        with IOService.open_text_writer(str(file_path)) as file:
+            file.write("new\n")
+
+        assert file_path.read_text(encoding="utf-8") == "new\n"
+        assert list(tmp_path.iterdir()) == [file_path]
+
+    def test_read_missing_file(self, tmp_path):
+        """Test reading a file that does not exist."""
+        with pytest.raises(FileNotFoundError):
+            IOService.read_text_file(str(tmp_path / "missing.txt"))
+
+    def test_json_round_trip(self, tmp_path):
+        """Test writing and reading a JSON file."""
+        file_path = tmp_path / "nested" / "data.json"
+        data = {"words": ["cjase", "sûr"], "count": 2}
+
+        IOService.write_json_file(str(file_path), data)
+
+        assert IOService.read_json_file(str(file_path)) == data
+        assert "sûr" in file_path.read_text(encoding="utf-8")
+
+    def test_write_json_failure_keeps_existing_file(self, tmp_path):
+        """Test that a serialization error leaves the previous JSON intact."""
+        file_path = tmp_path / "data.json"
+        IOService.write_json_file(str(file_path), {"count": 2})
+
+        with pytest.raises(TypeError):
+            IOService.write_json_file(str(file_path), {"count": 3, "words": {"cjase"}})
+
+        assert IOService.read_json_file(str(file_path)) == {"count": 2}
+        assert [entry.name for entry in tmp_path.iterdir()] == ["data.json"]
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_read_json_with_and_without_orjson(self, tmp_path, monkeypatch, use_orjson):
+        """Test that JSON parsing is the same with and without orjson."""
+        if not use_orjson:
+            monkeypatch.setitem(sys.modules, "orjson", None)
+        file_path = tmp_path / "data.json"
+        file_path.write_text('{"words": ["cjase", "s\u00fbr"], "count": 2}', encoding="utf-8")
+
+        assert IOService.read_json_file(str(file_path)) == {"words": ["cjase", "sûr"], "count": 2}
+        with pytest.raises(FileNotFoundError):
+            IOService.read_json_file(str(tmp_path / "missing.json"))
+
+        file_path.write_text("{", encoding="utf-8")
+        with pytest.raises(json.JSONDecodeError):
+            IOService.read_json_file(str(file_path))
+
+        # orjson rejects these; the json fallback must accept them either way
+        file_path.write_text('{"score": NaN, "char": "\\ud800"}', encoding="utf-8")
+        data = IOService.read_json_file(str(file_path))
+        assert data["score"] != data["score"]
+        assert data["char"] == "\ud800"
+
+    def test_word_list_round_trip(self, tmp_path):
+        """Test writing and reading a word list."""
+        file_path = tmp_path / "words.txt"
+
+        IOService.write_word_list(str(file_path), ["cjase", "", "# comment", "fradi"])
+
+        assert IOService.read_word_list(str(file_path)) == ["cjase", "fradi"]
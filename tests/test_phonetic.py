@@ -0,0 +1,78 @@
+"""Test FurlanPhoneticAlgorithm functionality."""
+
+from furlan_spellchecker.phonetic import FurlanPhoneticAlgorithm
+
+
+class TestFurlanPhoneticAlgorithm:
+    """Test FurlanPhoneticAlgorithm functionality."""
+
+    def test_empty_word(self):
+        """Test that an empty word has an empty code."""
+        algorithm = FurlanPhoneticAlgorithm()
+
+        assert algorithm.get_phonetic_code("") == ""
+
+    def test_diacritics_are_folded(self):
+        """Test that accented letters map to their base letter."""
+        algorithm = FurlanPhoneticAlgorithm()
+
+        assert algorithm.get_phonetic_code("cemût") == "cemut"
+        assert algorithm.get_phonetic_code("ÀÈÌÒÙ") == "aeiou"
+        assert algorithm.get_phonetic_code("piçul") == "picul"
+
+    def test_transformations(self):
+        """Test consonant groups and doubled consonants."""
+        algorithm = FurlanPhoneticAlgorithm()
+
+        assert algorithm.get_phonetic_code("che") == "ke"
+        assert algorithm.get_phonetic_code("vignî") == "viñi"
+        assert algorithm.get_phonetic_code("jessi") == "jesi"
+
+    def test_rule_order_is_preserved(self):
+        """Test chained consonant groups, vowel reductions and doubled consonants."""
+        algorithm = FurlanPhoneticAlgorithm()
+
+        assert algorithm.get_phonetic_code("ghn") == "ñ"
+        assert algorithm.get_phonetic_code("uoli") == "uli"
+        assert algorithm.get_phonetic_code("ieri") == "iri"
+        assert algorithm.get_phonetic_code("bbbb") == "bb"
+        assert algorithm.get_phonetic_code("pizzeria") == "pizeria"
+
+    def test_batch_matches_single_word_codes(self):
+        """Test that batch codes equal the per-word codes."""
+        algorithm = FurlanPhoneticAlgorithm()
+        words = ["cjase", "", "  Cemût ", "ghn", "pizzeria", "a\x00b", "scuele"]
+
+        assert algorithm.get_phonetic_codes(words) == [
+            algorithm.get_phonetic_code(word) for word in words
+        ]
+        assert algorithm.get_phonetic_codes(words[:-2]) == [
+            algorithm.get_phonetic_code(word) for word in words[:-2]
+        ]
+        assert algorithm.get_phonetic_codes([]) == []
+
+    def test_phonetic_code_cache(self):
+        """Test that codes are memoized within the cache bound."""
+        algorithm = FurlanPhoneticAlgorithm(cache_size=2)
+
+        for word in ["cjase", "cjase", "fradi", "cjase", "sûr"]:
+            algorithm.get_phonetic_code(word)
+
+        info = algorithm._cached_phonetic_code.cache_info()
+        assert info.hits == 2
+        assert info.currsize == 2
+
+        algorithm.get_phonetic_codes(["gjat", "pan"])
+        assert algorithm._cached_phonetic_code.cache_info().currsize == 2
+
+        algorithm.clear_cache()
+        assert algorithm._cached_phonetic_code.cache_info().currsize == 0
+
+    def test_phonetic_similarity(self):
+        """Test phonetic similarity between words."""
+        algorithm = FurlanPhoneticAlgorithm()
+
+        assert algorithm.are_phonetically_similar("jessi", "jesi")
+        assert algorithm.are_phonetically_similar("Cemût", "cemut")
+        assert not algorithm.are_phonetically_similar("cjase", "fradi")
+        assert not algorithm.are_phonetically_similar("", "cjase")
@@ -58,6 +58,30 @@ class TestSpellCheckPipeline:
         
         assert isinstance(suggestions, list)
 
+    @pytest.mark.asyncio
+    async def test_async_only_spell_checker(self, sample_dictionary):
+        """Test awaiting the pipeline with a checker that only implements async methods."""
+        from furlan_spellchecker.core.interfaces import ISpellChecker
+        from furlan_spellchecker.spellchecker import FurlanSpellChecker, TextProcessor
+
+        class AsyncOnlySpellChecker(FurlanSpellChecker):
+            check_word_sync = ISpellChecker.check_word_sync
+            get_word_suggestions_sync = ISpellChecker.get_word_suggestions_sync
+
+            async def check_word(self, word):
+                return FurlanSpellChecker.check_word_sync(self, word)
+
+            async def get_word_suggestions(self, word):
+                return FurlanSpellChecker.get_word_suggestions_sync(self, word)
+
+        checker = AsyncOnlySpellChecker(sample_dictionary, TextProcessor())
+        pipeline = SpellCheckPipeline(dictionary=sample_dictionary, spell_checker=checker)
+
+        result = await pipeline.check_word("cjasa")
+        assert result["is_correct"] is False
+        assert result["suggestions"] == ["cjase"]
+        assert await pipeline.get_suggestions("cjasa") == ["cjase"]
+
     def test_add_word_to_dictionary(self, spell_check_pipeline):
         """Test adding word to dictionary."""
         result = spell_check_pipeline.add_word_to_dictionary("newword")
@@ -78,4 +102,47 @@ class TestSpellCheckPipeline:
         dict_file.write_text("testword\nanotherword\n", encoding="utf-8")
         
         # Load should not raise error
-        spell_check_pipeline.load_dictionary(str(dict_file))
\ No newline at end of file
+        spell_check_pipeline.load_dictionary(str(dict_file))
+
+    def test_check_word_sync(self, spell_check_pipeline):
+        """Test the synchronous word check."""
+        assert spell_check_pipeline.check_word_sync("cjase")["is_correct"] is True
+
+        result = spell_check_pipeline.check_word_sync("cjasa")
+        assert result["is_correct"] is False
+        assert result["suggestions"] == ["cjase"]
+
+    def test_get_suggestions_sync_limit(self, spell_check_pipeline):
+        """Test that the suggestion limit is honoured."""
+        spell_check_pipeline.add_word_to_dictionary("fradis")
+
+        assert spell_check_pipeline.get_suggestions_sync("fradii") == ["fradi", "fradis"]
+        assert spell_check_pipeline.get_suggestions_sync("fradii", max_suggestions=1) == ["fradi"]
+
+    def test_interface_sync_defaults_delegate(self, sample_dictionary):
+        """Test that the interface's sync methods fall back to the async ones."""
+        from furlan_spellchecker.core.interfaces import ISpellChecker
+        from furlan_spellchecker.entities import ProcessedWord
+        from furlan_spellchecker.spellchecker import FurlanSpellChecker, TextProcessor
+
+        checker = FurlanSpellChecker(sample_dictionary, TextProcessor())
+
+        assert ISpellChecker.check_word_sync(checker, ProcessedWord("cjase")) is True
+        assert ISpellChecker.get_word_suggestions_sync(checker, ProcessedWord("cjasa")) == ["cjase"]
+
+    def test_get_suggestions_sync_above_default_limit(self):
+        """Test that limits above the dictionary default reach the dictionary."""
+        dictionary = Dictionary()
+        for index in range(15):
+            dictionary.add_word(f"cjase{chr(ord('a') + index)}")
+        pipeline = SpellCheckPipeline(dictionary=dictionary)
+
+        assert len(pipeline.get_suggestions_sync("cjase")) == 10
+        assert len(pipeline.get_suggestions_sync("cjase", max_suggestions=20)) == 15
+
+    def test_check_text_stream(self, spell_check_pipeline):
+        """Test checking text one line at a time."""
+        results = list(spell_check_pipeline.check_text_stream(["cjase fradi\n", "sûr\n"]))
+
+        assert [result["original_text"] for result in results] == ["cjase fradi", "sûr"]
+        assert [result["total_words"] for result in results] == [2, 1]
@@ -0,0 +1,141 @@
+"""Test RadixTree functionality."""
+
+from hypothesis import assume, given, strategies as st
+
+from furlan_spellchecker.dictionary import RadixTree, RadixTreeNode, levenshtein_distance
+
+
+class TestRadixTree:
+    """Test RadixTree functionality."""
+
+    def test_insert_and_search(self):
+        """Test inserting words that share and split edges."""
+        tree = RadixTree()
+        for word in ["cjase", "cjasis", "cjan", "cja", "cjase"]:
+            tree.insert(word)
+
+        assert tree.size() == 4
+        assert tree.search("cjase")
+        assert tree.search("cja")
+        assert not tree.search("cj")
+        assert not tree.search("cjases")
+
+    def test_starts_with(self):
+        """Test prefix queries ending inside and at the end of an edge."""
+        tree = RadixTree()
+        for word in ["cjase", "cjasis", "cjan", "fradi"]:
+            tree.insert(word)
+
+        assert tree.starts_with("cjas") == ["cjase", "cjasis"]
+        assert tree.starts_with("cja") == ["cjan", "cjase", "cjasis"]
+        assert tree.starts_with("") == ["cjan", "cjase", "cjasis", "fradi"]
+        assert tree.starts_with("x") == []
+        assert tree.starts_with("", limit=2) == ["cjan", "cjase"]
+        assert tree.starts_with("cjas", limit=1) == ["cjase"]
+
+    def test_get_suggestions(self):
+        """Test edit-distance suggestions, closest first."""
+        tree = RadixTree()
+        for word in ["cjase", "case", "cjases", "cjan", "fradi"]:
+            tree.insert(word)
+
+        assert tree.get_suggestions("cjase", 1) == ["case", "cjases"]
+        assert tree.get_suggestions("cjasa", 2) == ["cjase", "case", "cjan", "cjases"]
+        assert tree.get_suggestions("zzzzz", 2) == []
+        assert tree.get_suggestions("cjasa", 2, prefix_length=2) == ["cjase", "cjan", "cjases"]
+
+    def test_delete(self):
+        """Test deleting words and merging the remaining edges."""
+        tree = RadixTree()
+        for word in ["cjase", "cjasis", "cja"]:
+            tree.insert(word)
+
+        assert tree.delete("cjasis")
+        assert not tree.delete("cjasis")
+        assert not tree.delete("cj")
+        assert tree.size() == 2
+        assert tree.starts_with("c") == ["cja", "cjase"]
+
+        assert tree.delete("cja")
+        assert tree.search("cjase")
+        assert list(tree.root.children["c"].children) == []
+
+    def test_nodes_use_slots(self):
+        """Test that nodes carry no per-instance dictionary."""
+        assert not hasattr(RadixTreeNode(), "__dict__")
+
+
+_words = st.text(alphabet="acegijns", max_size=7)
+
+
+@given(st.sets(_words, max_size=40), _words, st.integers(1, 3))
+def test_suggestions_match_brute_force(words, word, max_distance):
+    """Test that the pruned walk finds exactly the words a full scan finds."""
+    tree = RadixTree()
+    for entry in words:
+        tree.insert(entry)
+
+    expected = sorted(
+        (levenshtein_distance(word, entry), entry)
+        for entry in words
+        if 0 < levenshtein_distance(word, entry) <= max_distance
+    )
+    assert tree.get_suggestions(word, max_distance) == [entry for _, entry in expected]
+
+
+@given(st.sets(_words, max_size=40), _words, st.integers(1, 3), st.integers(0, 3))
+def test_anchored_suggestions_match_brute_force(words, word, max_distance, prefix_length):
+    """Test that anchored suggestions are the full results sharing the prefix."""
+    tree = RadixTree()
+    for entry in words:
+        tree.insert(entry)
+
+    anchor = word[:prefix_length]
+    expected = [
+        entry for entry in tree.get_suggestions(word, max_distance) if entry.startswith(anchor)
+    ]
+    assert tree.get_suggestions(word, max_distance, prefix_length) == expected
+
+
+@given(
+    st.sets(_words, max_size=40),
+    _words,
+    st.integers(1, 3),
+    st.integers(0, 3),
+    st.integers(1, 4),
+)
+def test_excluded_prefix_suggestions_match_filter(
+    words, word, max_distance, prefix_length, excluded_prefix_length
+):
+    """Test that an excluded prefix removes exactly the words sharing it."""
+    assume(len(word) >= excluded_prefix_length)
+    tree = RadixTree()
+    for entry in words:
+        tree.insert(entry)
+
+    excluded = word[:excluded_prefix_length]
+    expected = [
+        (levenshtein_distance(word, entry), entry)
+        for entry in tree.get_suggestions(word, max_distance, prefix_length)
+        if not entry.startswith(excluded)
+    ]
+    assert sorted(expected) == tree.get_scored_suggestions(
+        word, max_distance, prefix_length, excluded_prefix_length
+    )
+
+
+@given(st.lists(_words, max_size=40), st.lists(_words, max_size=20))
+def test_insert_delete_match_set(inserted, deleted):
+    """Test that membership and prefixes track a plain set through edits."""
+    tree = RadixTree()
+    expected = set()
+    for entry in inserted:
+        tree.insert(entry)
+        expected.add(entry)
+    for entry in deleted:
+        assert tree.delete(entry) == (entry in expected)
+        expected.discard(entry)
+
+    assert tree.size() == len(expected)
+    assert tree.starts_with("") == sorted(expected)
+    assert all(tree.search(entry) for entry in expected)
@@ -0,0 +1,48 @@
+"""Test TextProcessor functionality."""
+
+from furlan_spellchecker.entities import ProcessedPunctuation, ProcessedWord
+from furlan_spellchecker.spellchecker import TextProcessor
+
+
+class TestTextProcessor:
+    """Test TextProcessor functionality."""
+
+    def test_split_into_tokens(self):
+        """Test splitting text into words and punctuation."""
+        processor = TextProcessor()
+
+        tokens = processor.split_into_tokens("Cheste e je une frâs, in furlan!")
+
+        assert tokens == ["Cheste", "e", "je", "une", "frâs", ",", "in", "furlan", "!"]
+
+    def test_iter_words_keeps_elisions(self):
+        """Test that elided forms with either apostrophe stay whole."""
+        processor = TextProcessor()
+
+        words = processor.iter_words("L'aghe d\u2019invier, cu la ploe'.")
+
+        assert next(words) == "L'aghe"
+        assert list(words) == ["d\u2019invier", "cu", "la", "ploe"]
+        assert list(processor.iter_words("cafe\u0300 ")) == ["cafe\u0300"]
+
+    def test_process_text(self):
+        """Test that tokens become the matching processed elements."""
+        processor = TextProcessor()
+
+        elements = processor.process_text("Bon dì!")
+
+        assert [type(element) for element in elements] == [
+            ProcessedWord,
+            ProcessedWord,
+            ProcessedPunctuation,
+        ]
+        assert [element.original for element in elements] == ["Bon", "dì", "!"]
+
+    def test_token_classification(self):
+        """Test word and punctuation checks."""
+        processor = TextProcessor()
+
+        assert processor.is_word("cjase")
+        assert not processor.is_word(",")
+        assert processor.is_punctuation(",")
+        assert not processor.is_punctuation(" ")